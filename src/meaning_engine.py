@@ -1,33 +1,93 @@
 #!/usr/bin/env python3
-import os, json, sys
+import os, re, json, sys, hashlib, marshal, operator
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # ============================================================
 # Meaning IR v3 — Typed, Scoped, Callable, Intent-Based IR
 # ============================================================
 
+_UNSET = object()
+
 class SemanticNode:
-    def to_json(self): raise NotImplementedError
+    # nodes are immutable once built, so the serialized form and the
+    # first output text are cached
+    _json_cache = None
+    _first_output_text = _UNSET
+    # attributes holding child nodes (or sequences of them), in to_json() order
+    _children = ()
+
+    def to_json(self):
+        if self._json_cache is None: self._json_cache = self._json()
+        return self._json_cache
+
+    def _json(self): raise NotImplementedError
+
+    def find_first_output_text(self):
+        if self._first_output_text is _UNSET:
+            self._first_output_text = self._walk_first_output_text()
+        return self._first_output_text
+
+    def _walk_first_output_text(self):
+        # pre-order walk over child nodes, in the same order as to_json();
+        # one visitor lookup per node, scalar attributes fall straight through
+        stack=[self]
+        while stack:
+            n=stack.pop(); t=type(n)
+            visit=_OUTPUT_VISITORS.get(t, _UNSET)
+            if visit is _UNSET: visit=_output_visitor(t)
+            if visit is None: continue
+            r=visit(n, stack)
+            if r: return r
+        return None
+
+def _visit_output(n, stack): return n.msg or None
+def _visit_node(n, stack):
+    for a in reversed(n._children): stack.append(getattr(n, a))
+def _visit_seq(n, stack): stack.extend(reversed(n))
+
+# type -> visitor (None: nothing to search); filled in per type on first sight
+_OUTPUT_VISITORS = {list: _visit_seq, tuple: _visit_seq}
+
+def _output_visitor(t):
+    if issubclass(t, Output): v=_visit_output
+    elif issubclass(t, SemanticNode): v=_visit_node
+    else: v=None
+    _OUTPUT_VISITORS[t]=v
+    return v
 
 # ----- Values & Symbols -----
 
+# leaf nodes copy a class-level template instead of building a dict literal
+
 class Value(SemanticNode):
+    _T = {"intent": "value", "value": None}
     def __init__(self, value): self.value = value
-    def to_json(self): return {"intent": "value", "value": self.value}
+    def _json(self): d = Value._T.copy(); d["value"] = self.value; return d
 
 class TypedValue(SemanticNode):
+    _T = {"intent": "typed_value", "type": None, "value": None}
     def __init__(self, vtype, value): self.vtype = vtype; self.value = value
-    def to_json(self): return {"intent": "typed_value", "type": self.vtype, "value": self.value}
+    def _json(self):
+        d = TypedValue._T.copy(); d["type"] = self.vtype; d["value"] = self.value; return d
 
 class Symbol(SemanticNode):
+    _T = {"intent": "symbol", "name": None}
     def __init__(self, name): self.name = name
-    def to_json(self): return {"intent": "symbol", "name": self.name}
+    def _json(self): d = Symbol._T.copy(); d["name"] = self.name; return d
 
 # ----- Variables -----
 
 class Declare(SemanticNode):
+    _children = ("value",)
     def __init__(self, name, vtype, value):
         self.name = name; self.vtype = vtype; self.value = value
-    def to_json(self):
+    def _json(self):
         return {
             "intent": "declare",
             "name": self.name,
@@ -36,9 +96,10 @@ class Declare(SemanticNode):
         }
 
 class Assign(SemanticNode):
+    _children = ("value",)
     def __init__(self, name, value):
         self.name = name; self.value = value
-    def to_json(self):
+    def _json(self):
         return {
             "intent": "assign",
             "target": self.name,
@@ -48,13 +109,15 @@ class Assign(SemanticNode):
 # ----- Actions -----
 
 class Output(SemanticNode):
+    _T = {"intent": "output_text", "payload": None}
     def __init__(self, msg): self.msg = msg
-    def to_json(self): return {"intent": "output_text", "payload": self.msg}
+    def _json(self): d = Output._T.copy(); d["payload"] = self.msg; return d
 
 class Compare(SemanticNode):
+    _children = ("left", "right")
     def __init__(self, op, left, right):
         self.op=op; self.left=left; self.right=right
-    def to_json(self):
+    def _json(self):
         return {
             "intent": "compare",
             "operation": self.op,
@@ -63,20 +126,23 @@ class Compare(SemanticNode):
         }
 
 class Branch(SemanticNode):
+    _children = ("cond", "then_blk", "else_blk")
     def __init__(self, cond, then_blk, else_blk=None):
         self.cond=cond; self.then_blk=then_blk; self.else_blk=else_blk
-    def to_json(self):
+    def _json(self):
+        cond=self.cond; tb=self.then_blk; eb=self.else_blk
         return {
             "intent": "branch",
-            "condition": self.cond.to_json(),
-            "then": self.then_blk.to_json(),
-            "else": self.else_blk.to_json() if self.else_blk else None
+            "condition": cond.to_json(),
+            "then": tb.to_json(),
+            "else": eb.to_json() if eb else None
         }
 
 class Loop(SemanticNode):
+    _children = ("cond", "body")
     def __init__(self, cond, body):
         self.cond=cond; self.body=body
-    def to_json(self):
+    def _json(self):
         return {
             "intent": "loop_until_break",
             "condition": self.cond.to_json(),
@@ -84,17 +150,20 @@ class Loop(SemanticNode):
         }
 
 class Return(SemanticNode):
+    _children = ("value",)
     def __init__(self, value=None): self.value=value
-    def to_json(self):
+    def _json(self):
+        value=self.value
         return {
             "intent": "return",
-            "value": self.value.to_json() if self.value else None
+            "value": value.to_json() if value else None
         }
 
 class Call(SemanticNode):
+    _children = ("args",)
     def __init__(self, name, args):
         self.name=name; self.args=args
-    def to_json(self):
+    def _json(self):
         return {
             "intent": "call",
             "target": self.name,
@@ -104,13 +173,15 @@ class Call(SemanticNode):
 # ----- Block / Function / Program -----
 
 class Block(SemanticNode):
+    _children = ("actions",)
     def __init__(self, actions): self.actions=actions
-    def to_json(self): return {"intent": "block", "actions": [a.to_json() for a in self.actions]}
+    def _json(self): return {"intent": "block", "actions": [a.to_json() for a in self.actions]}
 
 class Function(SemanticNode):
+    _children = ("body",)
     def __init__(self, name, args, ret, body):
         self.name=name; self.args=args; self.ret=ret; self.body=body
-    def to_json(self):
+    def _json(self):
         return {
             "kind": "function",
             "name": self.name,
@@ -120,9 +191,16 @@ class Function(SemanticNode):
         }
 
 class Program(SemanticNode):
-    def __init__(self, functions, meta=None):
+    _children = ("functions",)
+    # output_texts: optional payloads of every Output in pre-order, recorded
+    # by the parser so the first one is found without walking the tree
+    def __init__(self, functions, meta=None, output_texts=None):
         self.functions=functions; self.meta=meta or {}
-    def to_json(self):
+        self._output_texts=output_texts
+    def find_first_output_text(self):
+        if self._output_texts is None: return super().find_first_output_text()
+        return next((t for t in self._output_texts if t), None)
+    def _json(self):
         return {
             "meta": self.meta,
             "functions": [f.to_json() for f in self.functions]
@@ -132,169 +210,500 @@ class Program(SemanticNode):
 # Meaning VM v3
 # ============================================================
 
-class VMReturn(Exception):
-    def __init__(self, value=None): self.value=value
+# ----- Opcodes -----
+# Function bodies are compiled once into flat lists of (opcode, *operands)
+# tuples; expressions leave their result on the VM value stack. Name
+# operands are interned so env/function lookups hit on identity.
+
+OP_CONST, OP_LOAD, OP_STORE, OP_POP, OP_OUTPUT, OP_COMPARE, \
+    OP_JMP, OP_JMP_IF_FALSE, OP_RETURN, OP_CALL, OP_ARGS = range(11)
+
+EXPR_INTENTS = {"value", "typed_value", "symbol", "compare", "call"}
+CONST_INTENTS = {"value", "typed_value"}
 
-class Frame:
-    def __init__(self): self.env={}
+# bump when the cache format changes; engine edits invalidate it by mtime
+BYTECODE_VERSION = 4
+
+_CMP = {"greater_than": operator.gt, "equal": operator.eq, "less_than": operator.lt}
+
+# unknown operations compile fine and only fail if the compare is executed
+def _compare_op(node): return sys.intern(node["operation"])
+
+# a return jumps here: past the end of any code stream, so the run loop exits
+RETURN_PC = sys.maxsize
 
 class MeaningVM:
-    def __init__(self, ir_json):
-        self.functions = {fn["name"]: fn for fn in ir_json["functions"]}
-        self.stack=[]
+    # compiled: a (code, consts) pair from the bytecode cache; ir_loader: called
+    # to fetch the IR if a cached program reaches a function it does not hold
+    def __init__(self, ir_json=None, compiled=None, ir_loader=None):
+        self.functions = self._index(ir_json) if ir_json else {}
+        self._ir_loader = ir_loader
+        self.envs=[]
+        self._env_pool=[]
+        self.values=[]
+        self.pc=0
+        self._retval=None
+        # function bodies are compiled lazily, on first call
+        if compiled:
+            self.code, self.consts = compiled
+        else:
+            self.code={}; self.consts=[]
+        handlers = {
+            OP_CONST: self._op_const,
+            OP_LOAD: self._op_load,
+            OP_STORE: self._op_store,
+            OP_POP: self._op_pop,
+            OP_OUTPUT: self._op_output,
+            OP_COMPARE: self._op_compare,
+            OP_JMP: self._op_jmp,
+            OP_JMP_IF_FALSE: self._op_jmp_if_false,
+            OP_RETURN: self._op_return,
+            OP_CALL: self._op_call,
+            OP_ARGS: self._op_args,
+        }
+        # opcodes are dense small ints, so dispatch is a plain list index
+        self._table = [handlers[op] for op in sorted(handlers)]
+
+    @staticmethod
+    def _index(ir_json): return {sys.intern(fn["name"]): fn for fn in ir_json["functions"]}
 
-    def push(self): self.stack.append(Frame())
-    def pop(self): self.stack.pop()
-    @property
-    def env(self): return self.stack[-1].env
+    def _code(self, name):
+        code=self.code.get(name)
+        if code is None:
+            if name not in self.functions and self._ir_loader:
+                self.functions=self._index(self._ir_loader()); self._ir_loader=None
+            code=self.code[name]=self._compile(self.functions[name])
+        return code
+
+    # only the functions compiled so far, e.g. for the bytecode cache
+    def compiled(self): return self.code, self.consts
+
+    # env dicts are recycled through a free list instead of reallocated per call
+    def push(self): self.envs.append(self._env_pool.pop() if self._env_pool else {})
+    def pop(self):
+        env=self.envs.pop(); env.clear(); self._env_pool.append(env)
 
     def run(self):
         self.push()
-        main = self.functions["main"]
-        self.exec(main["body"])
-
-    def exec(self, node):
+        self._execute(self._code("main"))
+
+    def _execute(self, code):
+        table=self._table
+        pc=0; n=len(code)
+        while pc<n:
+            op=code[pc]
+            self.pc=pc+1
+            table[op[0]](op)
+            pc=self.pc
+
+    # ----- compiler -----
+
+    def _compile(self, fn):
+        # every body opens with its parameter names; _op_call checks the
+        # arity against them and binds the arguments before the body runs
+        code=[(OP_ARGS, tuple(sys.intern(arg["name"]) for arg in fn["args"]))]
+        self._emit_stmt(self._fold(fn["body"]), code)
+        return code
+
+    def _fold(self, node):
+        # post-order constant folding; returns new nodes, the IR is not mutated
+        if type(node) is list: return [self._fold(n) for n in node]
+        if type(node) is not dict or node.get("intent") in CONST_INTENTS: return node
+
+        node={k: self._fold(v) for k, v in node.items()}
+        if node.get("intent")=="compare":
+            l=node["left"]; r=node["right"]
+            cmp=_CMP.get(node["operation"])
+            if cmp and l.get("intent") in CONST_INTENTS and r.get("intent") in CONST_INTENTS:
+                try:
+                    return {"intent": "value", "value": cmp(l["value"], r["value"])}
+                except TypeError:
+                    pass  # incomparable literals: leave it to fail only if executed
+        return node
+
+    def _const(self, value):
+        self.consts.append(value)
+        return len(self.consts)-1
+
+    def _emit_stmt(self, node, code):
+        self._emit(node, code)
+        if node.get("intent") in EXPR_INTENTS: code.append((OP_POP,))
+
+    def _emit(self, node, code):
         intent=node.get("intent")
 
         if intent=="block":
-            for a in node["actions"]: self.exec(a); return
+            for a in node["actions"]: self._emit_stmt(a, code)
 
-        if intent=="declare": self.env[node["name"]] = self.exec(node["value"]); return
-        if intent=="assign": self.env[node["target"]] = self.exec(node["value"]); return
+        elif intent=="declare":
+            self._emit(node["value"], code); code.append((OP_STORE, sys.intern(node["name"])))
+        elif intent=="assign":
+            self._emit(node["value"], code); code.append((OP_STORE, sys.intern(node["target"])))
 
-        if intent=="symbol": return self.env[node["name"]]
-        if intent=="value": return node["value"]
-        if intent=="typed_value": return node["value"]
+        elif intent=="symbol": code.append((OP_LOAD, sys.intern(node["name"])))
+        elif intent in ("value", "typed_value"): code.append((OP_CONST, self._const(node["value"])))
 
-        if intent=="output_text": print(node["payload"]); return
+        elif intent=="output_text": code.append((OP_OUTPUT, node["payload"]))
 
-        if intent=="compare":
-            l=self.exec(node["left"]); r=self.exec(node["right"])
-            if node["operation"]=="greater_than": return l>r
-            if node["operation"]=="equal": return l==r
-            if node["operation"]=="less_than": return l<r
+        elif intent=="compare":
+            self._emit(node["left"], code); self._emit(node["right"], code)
+            code.append((OP_COMPARE, _compare_op(node)))
 
-        if intent=="branch":
-            if self.exec(node["condition"]): return self.exec(node["then"])
+        elif intent=="branch":
+            cond=node["condition"]
+            if cond.get("intent") in CONST_INTENTS:
+                # decided at compile time: emit only the live arm
+                live=node["then"] if cond["value"] else node["else"]
+                if live: self._emit_stmt(live, code)
             else:
-                if node["else"]: return self.exec(node["else"])
-            return
+                self._emit(cond, code)
+                jf=len(code); code.append(None)
+                self._emit_stmt(node["then"], code)
+                if node["else"]:
+                    j=len(code); code.append(None)
+                    code[jf]=(OP_JMP_IF_FALSE, len(code))
+                    self._emit_stmt(node["else"], code)
+                    code[j]=(OP_JMP, len(code))
+                else:
+                    code[jf]=(OP_JMP_IF_FALSE, len(code))
+
+        elif intent=="loop_until_break":
+            cond=node["condition"]
+            top=len(code)
+            if cond.get("intent") in CONST_INTENTS:
+                # constant condition: either dead, or body + back-jump with no test
+                if cond["value"]:
+                    self._emit_stmt(node["body"], code)
+                    code.append((OP_JMP, top))
+            else:
+                self._emit(cond, code)
+                jf=len(code); code.append(None)
+                self._emit_stmt(node["body"], code)
+                code.append((OP_JMP, top))
+                code[jf]=(OP_JMP_IF_FALSE, len(code))
+
+        elif intent=="return":
+            if node["value"]:
+                self._emit(node["value"], code); code.append((OP_RETURN, True))
+            else:
+                code.append((OP_RETURN, False))
+
+        elif intent=="call":
+            for a in node["args"]: self._emit(a, code)
+            code.append((OP_CALL, sys.intern(node["target"]), len(node["args"])))
 
-        if intent=="loop_until_break":
-            while self.exec(node["condition"]): self.exec(node["body"])
-            return
+        else:
+            raise Exception(f"Unknown intent: {intent}")
 
-        if intent=="return":
-            val=self.exec(node["value"]) if node["value"] else None
-            raise VMReturn(val)
+    # ----- opcode handlers -----
 
-        if intent=="call":
-            fn=self.functions[node["target"]]
-            args=[self.exec(a) for a in node["args"]]
+    def _op_const(self, op): self.values.append(self.consts[op[1]])
+    def _op_load(self, op): self.values.append(self.envs[-1][op[1]])
+    def _op_store(self, op): self.envs[-1][op[1]] = self.values.pop()
+    def _op_pop(self, op): self.values.pop()
 
-            self.push()
-            for i, arg in enumerate(fn["args"]):
-                self.env[arg["name"]] = args[i]
+    def _op_output(self, op): print(op[1])
 
-            try:
-                self.exec(fn["body"])
-            except VMReturn as ret:
-                self.pop()
-                return ret.value
+    def _op_compare(self, op):
+        r=self.values.pop(); l=self.values.pop()
+        try: cmp=_CMP[op[1]]
+        except KeyError: raise Exception(f"Unknown compare operation: {op[1]}") from None
+        self.values.append(cmp(l, r))
 
-            self.pop()
-            return
+    def _op_jmp(self, op): self.pc=op[1]
+    def _op_jmp_if_false(self, op):
+        if not self.values.pop(): self.pc=op[1]
 
-        raise Exception(f"Unknown intent: {intent}")
+    def _op_return(self, op):
+        self._retval=self.values.pop() if op[1] else None
+        self.pc=RETURN_PC
+
+    def _op_args(self, op): pass  # already bound by the caller
+
+    def _op_call(self, op):
+        _, target, argc = op
+        code=self.code.get(target) or self._code(target)
+        params=code[0][1]
+        if argc<len(params):
+            raise Exception(f"{target} expects {len(params)} arguments, got {argc}")
+        pc=self.pc
+
+        # surplus arguments are evaluated but not bound
+        values=self.values; base=len(values)-argc
+        self.push()
+        self.envs[-1].update(zip(params, values[base:]))
+        del values[base:]
+        self._execute(code)
+        self.pop()
+        # falling off the end of the body leaves _retval as None
+        value=self._retval; self._retval=None
+        values.append(value)
+        self.pc=pc
 
 # ============================================================
 # Dummy Parser → IR v3 생성
 # ============================================================
 
 def parse_to_ir_v3(path):
+    outputs=[]
+    def output(msg):
+        # leaves are built in source order, which is the tree's pre-order
+        outputs.append(msg); return Output(msg)
+
     main = Function(
         "main", [], "unit",
         Block([
             Declare("x","int",Value(10)),
             Branch(
                 Compare("greater_than", Symbol("x"), Value(5)),
-                Block([Output("x is greater than 5")])
+                Block([output("x is greater than 5")])
             ),
-            Loop(Value(True), Block([Output("loop"), Return()]))
+            Loop(Value(True), Block([output("loop"), Return()]))
         ])
     )
-    return Program([main], meta={"source":"meaning-ir-v3"})
+    return Program([main], meta={"source":"meaning-ir-v3"}, output_texts=outputs)
 
 # ============================================================
 # Backend Emitters
 # ============================================================
 
-def extract_msg(ir):
-    def dfs(n):
-        if isinstance(n,dict) and n.get("intent")=="output_text":
-            return n["payload"]
-        if isinstance(n,dict):
-            for v in n.values():
-                r=dfs(v); 
-                if r: return r
-        if isinstance(n,list):
-            for x in n:
-                r=dfs(x); 
-                if r: return r
-    return dfs(ir) or "Hello from IR v3"
+DEFAULT_MSG = "Hello from IR v3"
+
+# ----- Backend templates -----
+# Backend sources are written with a single {msg} placeholder and compiled
+# once at import into bytes prefix/suffix pairs; rendering is then just
+# concatenation.
+
+C_SRC = '#include <stdio.h>\nint main(){printf("{msg}\\n");}\n'
+
+JAVA_SRC = 'public class Main{public static void main(String[]a){System.out.println("{msg}");}}'
+
+CS_SRC = 'using System;class Program{static void Main(){Console.WriteLine("{msg}");}}'
+
+ASM_LINES = [
+    "global _start",
+    "section .text",
+    "_start:",
+    "    mov rax,1",
+    "    mov rdi,1",
+    "    mov rsi,msg",
+    "    mov rdx,msg_len",
+    "    syscall",
+    "    mov rax,60",
+    "    xor rdi,rdi",
+    "    syscall",
+    "section .data",
+    "msg db {msg},10",
+    "msg_len equ $-msg",
+]
+ASM_SRC = "\n".join(ASM_LINES) + "\n"
+
+def _compile_template(src):
+    prefix, suffix = src.encode().split(b"{msg}")
+    return prefix, suffix
+
+# ----- Message escaping -----
+# str.translate tables per target language, built once. Control characters
+# without a short escape use octal in C/Java (Java must not see \u000a, which
+# it decodes before lexing) and \uXXXX in C#.
+
+_SHORT_ESCAPES = {ord("\\"): "\\\\", ord('"'): '\\"', ord("\n"): "\\n", ord("\r"): "\\r", ord("\t"): "\\t"}
+
+def _escape_table(ctrl):
+    table = {c: ctrl % c for c in [*range(32), 127]}
+    table.update(_SHORT_ESCAPES)
+    return table
+
+_C_ESCAPES = {**_escape_table("\\%03o"), ord("%"): "%%"}  # printf format string
+_JAVA_ESCAPES = _escape_table("\\%03o")
+_CS_ESCAPES = _escape_table("\\u%04x")
+
+def _asm_operand(msg):
+    # NASM "..." strings have no escapes: quote printable runs, emit other bytes as numbers
+    parts=[]; run=""
+    for b in msg.encode():
+        if 32<=b<127 and b!=34: run+=chr(b); continue
+        if run: parts.append(f'"{run}"'); run=""
+        parts.append(str(b))
+    if run or not parts: parts.append(f'"{run}"')
+    return ",".join(parts)
+
+# output path -> (prefix, suffix, message form spliced between them)
+BACKEND_TEMPLATES = {
+    "llvm/main.c": (*_compile_template(C_SRC), "c"),
+    "jvm/Main.java": (*_compile_template(JAVA_SRC), "java"),
+    "dotnet/Program.cs": (*_compile_template(CS_SRC), "cs"),
+    "native/main.asm": (*_compile_template(ASM_SRC), "asm"),
+}
+
+# directories already created by this process; skips repeat stat/mkdir calls
+_made_dirs=set()
+
+def _ensure_dir(path):
+    if path in _made_dirs: return
+    os.makedirs(path, exist_ok=True)
+    _made_dirs.add(path)
+
+# shared across calls so batch transpiles do not spawn writer threads each time
+_write_pool=None
+
+def _writer_pool():
+    global _write_pool
+    if _write_pool is None: _write_pool=ThreadPoolExecutor(max_workers=5)
+    return _write_pool
+
+# raw fd writes: the bodies are already bytes, so skip the io wrapper layers
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+def _write_file(item):
+    path, content = item
+    # write a sibling temp file, then rename it over the target: a crash
+    # mid-flush never leaves a truncated output behind
+    tmp = f"{path}.tmp.{os.getpid()}"
+    try:
+        fd = os.open(tmp, _WRITE_FLAGS, 0o644)
+        try:
+            view = memoryview(content)
+            while view: view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+        os.replace(tmp, path)
+    except BaseException:
+        # never leave the temp file in the output tree
+        try: os.unlink(tmp)
+        except OSError: pass
+        raise
+
+# the only place outputs touch the filesystem; rendered is (relative path, bytes)
+def _flush(out, rendered):
+    # join each path once; the parent directories fall out of the same objects
+    root = Path(out)
+    items = [(root / rel, body) for rel, body in rendered]
+    for d in {path.parent for path, _ in items}: _ensure_dir(d)
+    # the files are independent; overlap their writes
+    list(_writer_pool().map(_write_file, items))
+
+# renders every backend source in memory as (relative path, bytes) pairs
+def render_backends(ir_obj):
+    msg = ir_obj.find_first_output_text() or DEFAULT_MSG
+    # escape once per target language, shared by every template using it
+    forms = {
+        "c": msg.translate(_C_ESCAPES).encode(),
+        "java": msg.translate(_JAVA_ESCAPES).encode(),
+        "cs": msg.translate(_CS_ESCAPES).encode(),
+        "asm": _asm_operand(msg).encode(),
+    }
+    return [(rel, prefix + forms[form] + suffix)
+            for rel, (prefix, suffix, form) in BACKEND_TEMPLATES.items()]
 
 def emit_backends(ir_obj, out):
-    os.makedirs(f"{out}/llvm", exist_ok=True)
-    os.makedirs(f"{out}/jvm", exist_ok=True)
-    os.makedirs(f"{out}/dotnet", exist_ok=True)
-    os.makedirs(f"{out}/native", exist_ok=True)
-
-    ir_json = ir_obj.to_json()
-    msg = extract_msg(ir_json)
-
-    open(f"{out}/llvm/main.c","w").write(
-        f'#include <stdio.h>\nint main(){{printf("{msg}\\n");}}\n'
-    )
-
-    open(f"{out}/jvm/Main.java","w").write(
-        f'public class Main{{public static void main(String[]a){{System.out.println("{msg}");}}}}'
-    )
-
-    open(f"{out}/dotnet/Program.cs","w").write(
-        f'using System;class Program{{static void Main(){{Console.WriteLine("{msg}");}}}}'
-    )
-
-    open(f"{out}/native/main.asm","w").write(
-f"""global _start
-section .text
-_start:
-    mov rax,1
-    mov rdi,1
-    mov rsi,msg
-    mov rdx,{len(msg)+1}
-    syscall
-    mov rax,60
-    xor rdi,rdi
-    syscall
-section .data
-msg db "{msg}",10
-"""
-)
+    # render everything before touching the filesystem: a rendering error
+    # can no longer leave a half-written output tree behind
+    _flush(out, render_backends(ir_obj))
 
 # ============================================================
 # Main transpile
 # ============================================================
 
+# None when some source file cannot be read: the outputs are then always regenerated
+def _source_digest(src, out):
+    # keyed on the engine's mtime too, so editing the transpiler invalidates outputs
+    h = hashlib.blake2b(b"%d:" % os.stat(__file__).st_mtime_ns, digest_size=16)
+    try:
+        if os.path.isdir(src):
+            skip = {os.path.realpath(out), "__pycache__"}
+            for root, dirs, files in os.walk(src):
+                dirs[:] = sorted(d for d in dirs
+                                 if d not in skip and os.path.realpath(os.path.join(root, d)) not in skip)
+                for name in sorted(files):
+                    path = os.path.join(root, name)
+                    # regular files only: broken links and FIFOs are never opened
+                    if not os.path.isfile(path): continue
+                    h.update(os.path.relpath(path, src).encode() + b"\0")
+                    with open(path,"rb") as f: h.update(f.read())
+        elif os.path.isfile(src):
+            with open(src,"rb") as f: h.update(f.read())
+    except OSError:
+        return None
+    return h.hexdigest()
+
+def _up_to_date(out, stamp, digest):
+    try:
+        with open(stamp) as f:
+            if f.read() != digest: return False
+    except OSError:
+        return False
+    return all(os.path.exists(f"{out}/{rel}") for rel in ("ir.json", *BACKEND_TEMPLATES))
+
+# ir.json is a machine artifact: compact unless NASM_IR_PRETTY=1
+def _dump_ir(ir, pretty):
+    if orjson:
+        try: return orjson.dumps(ir.to_json(),option=orjson.OPT_INDENT_2 if pretty else None)
+        except orjson.JSONEncodeError: pass  # e.g. ints past 64 bits: stdlib json takes them
+    if pretty: return json.dumps(ir.to_json(),indent=2).encode()
+    return json.dumps(ir.to_json(),separators=(",",":")).encode()
+
+# orjson reads ints outside 64 bits back as floats; any 19+ digit run may be one
+_LONG_DIGITS = re.compile(rb"\d{19}")
+
+def _load_ir(raw):
+    if orjson and not _LONG_DIGITS.search(raw): return orjson.loads(raw)
+    return json.loads(raw)
+
 def transpile(src, out):
+    # unchanged input and engine: the previous outputs are still valid
+    pretty = os.environ.get("NASM_IR_PRETTY") == "1"
+    digest = _source_digest(src, out)
+    stamp = f"{out}/.transpile_stamp"
+    if digest is None:
+        try: os.unlink(stamp)
+        except OSError: pass
+    else:
+        digest += "-pretty" if pretty else ""
+        if _up_to_date(out, stamp, digest): return
+
     ir = parse_to_ir_v3(src)
-    os.makedirs(out, exist_ok=True)
-    open(f"{out}/ir.json","w").write(json.dumps(ir.to_json(),indent=2))
-    emit_backends(ir,out)
+    # ir.json joins the backend sources in one render-then-flush batch
+    _flush(out, [("ir.json", _dump_ir(ir, pretty)), *render_backends(ir)])
+    if digest: _write_file((stamp, digest.encode()))
+
+def _bytecode_path(raw):
+    cache = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    # salted with the engine's mtime, like the transpile stamp, so any edit to
+    # the compiler invalidates cached bytecode even without a version bump
+    salt = b"%d:%d:" % (BYTECODE_VERSION, os.stat(__file__).st_mtime_ns)
+    h = hashlib.blake2b(salt + raw, digest_size=8).hexdigest()
+    return os.path.join(cache, "meaning_vm", f"{h}.mir")
+
+def _load_bytecode(path):
+    try:
+        with open(path,"rb") as f: return marshal.load(f)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+
+def _store_bytecode(path, compiled):
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{os.getpid()}"
+        with open(tmp,"wb") as f: marshal.dump(compiled, f)
+        os.replace(tmp, path)
+    except OSError:
+        pass
 
 def run_vm(ir_path):
-    ir=json.load(open(ir_path))
-    vm=MeaningVM(ir)
+    raw=open(ir_path,"rb").read()
+    path=_bytecode_path(raw)
+    parse=lambda: _load_ir(raw)
+    compiled=_load_bytecode(path)
+    if compiled:
+        cached=len(compiled[0])
+        vm=MeaningVM(compiled=compiled, ir_loader=parse)
+    else:
+        cached=0
+        vm=MeaningVM(parse())
     vm.run()
+    # cache what this run compiled; a later run reaching more code extends it
+    if len(vm.code)>cached: _store_bytecode(path, vm.compiled())
 
 if __name__ == "__main__":
     mode=sys.argv[1]
@@ -306,4 +715,5 @@ if __name__ == "__main__":
         print("usage:")
         print("  meaning_engine.py transpile src/ out/")
         print("  meaning_engine.py runvm out/ir.json")
+        print("  (set NASM_IR_PRETTY=1 for an indented ir.json)")
 